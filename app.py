@@ -13,7 +13,7 @@ import streamlit as st
 from src import coach_engine, feedback_engine, lesson_engine, revision_engine, storage
 from src.config import has_openai_api_key
 from src.exercise_engine import load_or_build_exercises
-from src.pdf_ingest import chunks_by_unit, load_or_build_chunks
+from src.pdf_ingest import group_chunks_by_unit, load_or_build_chunks
 from src.types import CourseUnit, FeedbackReport, LessonPack, RevisionMission
 from src.unit_catalog import load_units
 
@@ -95,7 +95,7 @@ def _confidence_tone(confidence: float | None) -> str:
 
 @st.cache_resource
 def _load_assets() -> tuple[
-    List[CourseUnit],
+    tuple[CourseUnit, ...],
     list[dict],
     Dict[str, List[dict]],
     Dict[str, LessonPack],
@@ -104,7 +104,8 @@ def _load_assets() -> tuple[
 
     units = load_units()
     all_chunks = load_or_build_chunks(units)
-    unit_chunks = {unit.id: chunks_by_unit(unit, all_chunks) for unit in units}
+    chunks_by_unit_id = group_chunks_by_unit(all_chunks)
+    unit_chunks = {unit.id: chunks_by_unit_id.get(unit.id, []) for unit in units}
     exercise_map = load_or_build_exercises(units, unit_chunks)
     lesson_pack_map = lesson_engine.load_or_build_lesson_packs(units, unit_chunks)
     return units, all_chunks, exercise_map, lesson_pack_map
@@ -6,7 +6,8 @@ import json
 import math
 import re
 from collections import Counter
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 
 from .config import get_openai_api_key, get_openai_model, has_openai_api_key
 from .types import CoachAnswer, CoachEvidence
@@ -100,16 +101,28 @@ _OFF_TOPIC_KEYWORDS = {
 _RELEVANCE_MIN_OVERLAP = 1
 _RELEVANCE_RATIO = 0.15
 _CITATION_RE = re.compile(r"^p\.(\d+)$")
+_TOKEN_RE = re.compile(r"[a-z]{2,}")
 
 
-def _tokenize(text: str) -> List[str]:
-    """Tokenize text into lowercase alpha tokens with stop-word filtering."""
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """Tokenize text into lowercase alpha tokens with stop-word filtering.
 
-    tokens = re.findall(r"[a-z]{2,}", text.lower())
-    return [token for token in tokens if token not in _STOP_WORDS]
+    Cached on the raw text: chunk texts and repeated questions are tokenized once.
+    """
 
+    tokens = _TOKEN_RE.findall(text.lower())
+    return tuple(token for token in tokens if token not in _STOP_WORDS)
 
-def _relevance_metrics(question_tokens: List[str], chunk_tokens: List[str]) -> Tuple[float, int]:
+
+@lru_cache(maxsize=1024)
+def _token_set(text: str) -> FrozenSet[str]:
+    """Return the cached distinct-token set for one text."""
+
+    return frozenset(_tokenize(text))
+
+
+def _relevance_metrics(question_tokens: Tuple[str, ...], chunk_tokens: Tuple[str, ...]) -> Tuple[float, int]:
     """Compute overlap ratio and overlap count between two token sequences."""
 
     if not question_tokens:
@@ -121,7 +134,7 @@ def _relevance_metrics(question_tokens: List[str], chunk_tokens: List[str]) -> T
     return (len(overlap) / len(qset), len(overlap))
 
 
-def _chunk_text_tokens(chunk: Dict[str, object]) -> List[str]:
+def _chunk_text_tokens(chunk: Dict[str, object]) -> Tuple[str, ...]:
     """Extract normalized tokens for one chunk."""
 
     return _tokenize(str(chunk.get("text", "")))
@@ -137,22 +150,24 @@ def _rank_chunks(question: str, chunks: List[Dict[str, object]]) -> List[Dict[st
     if not question_tokens:
         return []
 
-    question_set = set(question_tokens)
-    tokenized_chunks = [_chunk_text_tokens(chunk) for chunk in chunks]
+    question_set = _token_set(question)
+    chunk_texts = [str(chunk.get("text", "")) for chunk in chunks]
+    tokenized_chunks = [_tokenize(text) for text in chunk_texts]
+    chunk_sets = [_token_set(text) for text in chunk_texts]
+    question_count = len(question_set)
     try:
         total_chunks = len(chunks)
         if total_chunks == 0:
             return []
 
         doc_freq = Counter()
-        for tokens in tokenized_chunks:
-            doc_freq.update(set(tokens))
+        for chunk_set in chunk_sets:
+            doc_freq.update(chunk_set)
 
         ranked: List[Tuple[float, Dict[str, object]]] = []
-        for chunk, chunk_tokens in zip(chunks, tokenized_chunks):
-            overlap_ratio, overlap_count = _relevance_metrics(
-                question_tokens=question_tokens, chunk_tokens=chunk_tokens
-            )
+        for chunk, chunk_tokens, chunk_set in zip(chunks, tokenized_chunks, chunk_sets):
+            overlap_count = len(question_set & chunk_set)
+            overlap_ratio = overlap_count / question_count
             if overlap_count < _RELEVANCE_MIN_OVERLAP or overlap_ratio < _RELEVANCE_RATIO:
                 continue
 
@@ -176,11 +191,9 @@ def _rank_chunks(question: str, chunks: List[Dict[str, object]]) -> List[Dict[st
     except Exception:
         # Fallback to simple overlap scoring if TF-IDF path fails.
         fallback: List[Tuple[float, Dict[str, object]]] = []
-        question_set = set(question_tokens)
-        for chunk, chunk_tokens in zip(chunks, tokenized_chunks):
-            overlap_ratio, overlap_count = _relevance_metrics(
-                question_tokens=question_tokens, chunk_tokens=chunk_tokens
-            )
+        for chunk, chunk_set in zip(chunks, chunk_sets):
+            overlap_count = len(question_set & chunk_set)
+            overlap_ratio = overlap_count / question_count
             if overlap_count >= _RELEVANCE_MIN_OVERLAP and overlap_ratio >= _RELEVANCE_RATIO:
                 fallback.append((overlap_ratio, chunk))
 
@@ -206,8 +219,7 @@ def _is_off_scope(question: str, best_chunk: Dict[str, object]) -> bool:
     if not tokens:
         return True
 
-    question_set = set(tokens)
-    if question_set.intersection(_OFF_TOPIC_KEYWORDS):
+    if not _token_set(question).isdisjoint(_OFF_TOPIC_KEYWORDS):
         return True
 
     chunk_text = str(best_chunk.get("text", ""))
@@ -279,7 +291,7 @@ def _normalize_answer_payload(payload: Dict[str, object], relevant_chunks: List[
     evidence_raw = payload.get("evidence") if isinstance(payload.get("evidence"), list) else []
     evidence: List[CoachEvidence] = []
     for item in evidence_raw:
-        if not isinstance(item, dict):
+        if type(item) is not dict:
             continue
         quote = str(item.get("quote", "")).strip()
         citation = str(item.get("citation", "")).strip()
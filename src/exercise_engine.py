@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
 from typing import Dict, List
 
+from . import jsonio
 from .config import data_dir, exercises_path
 from .types import CourseUnit, ExerciseSpec
 
@@ -20,6 +20,8 @@ _IMPERATIVE_PATTERNS = [
     r"\bexercise\b",
 ]
 
+_PROMPT_WORD_RE = re.compile(r"\w+")
+
 
 
 def extract_directive_lines(texts: List[Dict[str, object]], max_items: int = 3) -> List[str]:
@@ -50,6 +52,26 @@ def extract_directive_lines(texts: List[Dict[str, object]], max_items: int = 3)
 
 
 
+def _dedup_specs(specs: List[ExerciseSpec]) -> List[ExerciseSpec]:
+    """Drop specs whose prompt repeats an earlier one, keeping first occurrences.
+
+    Prompts are compared on their lowercased word sequence, so copies that only
+    differ in case, whitespace, or punctuation count as duplicates. One set lookup
+    per spec keeps this linear in the number of specs.
+    """
+
+    seen = set()
+    unique: List[ExerciseSpec] = []
+    for spec in specs:
+        key = " ".join(_PROMPT_WORD_RE.findall(spec.prompt.lower()))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(spec)
+    return unique
+
+
+
 def _is_valid_exercise_cache(
     payload: object, unit_ids: List[str]
 ) -> Dict[str, List[ExerciseSpec]] | None:
@@ -82,7 +104,7 @@ def _is_valid_exercise_cache(
 
     for unit_id in unit_ids:
         specs = mapped[unit_id]
-        if len(specs) != 2:
+        if len(specs) != 2 or len(_dedup_specs(specs)) != 2:
             return None
         kinds = [spec.kind for spec in specs]
         if kinds.count("core") != 1 or kinds.count("stretch") != 1:
@@ -206,7 +228,7 @@ def load_or_build_exercises(
 
     if path.exists():
         try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
+            raw = jsonio.load_file(path)
             cached = _is_valid_exercise_cache(raw, unit_ids)
             if cached is not None:
                 return cached
@@ -219,5 +241,5 @@ def load_or_build_exercises(
         mapped[unit.id] = build_exercises_for_unit(unit, chunks)
         payload.extend(spec.to_dict() for spec in mapped[unit.id])
 
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(jsonio.dumps(payload))
     return mapped
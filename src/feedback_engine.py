@@ -23,6 +23,12 @@ _REASONING_EFFORT_OPTIONS = {"none", "minimal", "low", "medium", "high", "xhigh"
 _FAST_MAX_CHARS = 900
 _DEEP_MIN_CHARS = 2200
 
+_LINE_SPLIT_RE = re.compile(r"\n+")
+_WORD_RE = re.compile(r"\b[a-z']+\b")
+_LANGUAGE_CUES = ("scene", "detail", "voice", "show", "saw", "heard")
+_STRENGTH_CUES = ("scene", "detail", "voice", "character", "perspective")
+_CONCRETE_CUES = ("show", "showed", "saw", "heard", "felt", "replied")
+
 
 def _read_env_float(name: str, default: float) -> float:
     raw = os.getenv(name)
@@ -58,8 +64,8 @@ def _fallback_report(unit: CourseUnit, draft_text: str, chunks: List[Dict[str, o
     draft_lower = text.lower()
     objective_hits = sum(1 for term in objective_terms if term and term in draft_lower)
 
-    lines = [line.strip() for line in re.split(r"\n+", text) if line.strip()]
-    words = re.findall(r"\b[a-z']+\b", draft_lower)
+    lines = [stripped for line in _LINE_SPLIT_RE.split(text) if (stripped := line.strip())]
+    words = _WORD_RE.findall(draft_lower)
     unique_words = len(set(words))
     line_count = len(lines)
 
@@ -69,9 +75,9 @@ def _fallback_report(unit: CourseUnit, draft_text: str, chunks: List[Dict[str, o
         100,
         22
         + int(unique_words * 0.35)
-        + (10 if any(word in draft_lower for word in ["scene", "detail", "voice", "show", "saw", "heard"]) else 0),
+        + (10 if any(word in draft_lower for word in _LANGUAGE_CUES) else 0),
     )
-    revision = min(100, 18 + len(lines) * 3 + (8 if len(text) > 240 else 0))
+    revision = min(100, 18 + line_count * 3 + (8 if len(text) > 240 else 0))
     rubric = {
         "concept_application": concept,
         "narrative_effectiveness": narrative,
@@ -109,7 +115,7 @@ def _fallback_report(unit: CourseUnit, draft_text: str, chunks: List[Dict[str, o
     strengths = []
     if line_count >= 3:
         strengths.append(f"The draft has a readable beat flow that can support revision work. ({citation})")
-    if any(word in draft_lower for word in ["scene", "detail", "voice", "character", "perspective"]):
+    if any(word in draft_lower for word in _STRENGTH_CUES):
         strengths.append(f"You already use concrete craft signals that readers can follow. ({citation})")
     if objective_hits > 0:
         strengths.append(f"Draft language maps to unit vocabulary in places. ({citation})")
@@ -121,7 +127,7 @@ def _fallback_report(unit: CourseUnit, draft_text: str, chunks: List[Dict[str, o
         risks.append(f"The draft may be too short for a full scene; add one more concrete beat. ({citation})")
     if objective_hits == 0:
         risks.append(f"Alignment with the unit goal is weak; restate one objective in scene terms. ({citation})")
-    if not any(word in draft_lower for word in ["show", "showed", "saw", "heard", "felt", "replied"]):
+    if not any(word in draft_lower for word in _CONCRETE_CUES):
         risks.append(f"Many moves are abstract; replace summary sentences with physical or behavioral detail. ({citation})")
     if not risks:
         risks.append(f"Line transitions need one clearer shift of stakes or perspective to avoid repetition. ({citation})")
@@ -191,18 +197,28 @@ def _parse_json_object(raw: str) -> Dict:
     return json.loads(raw[start : end + 1])
 
 
+def _clamp100(value: int) -> int:
+    # Comparisons instead of max(0, min(100, ...)): no builtin calls on the per-dimension path.
+    return 0 if value < 0 else 100 if value > 100 else value
+
+
+def _coerce_score(value: object) -> int:
+    """Coerce one rubric score to an int in 0-100; unparseable values score 0."""
+
+    # Model output is almost always a plain int already, so skip int() and its exception path.
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return 0
+    return _clamp100(value)
+
+
 def _normalize_report(payload: Dict, unit: CourseUnit, chunks: List[Dict[str, object]], original_score: int | None = None) -> FeedbackReport:
     report_payload = dict(payload or {})
 
     rubric = report_payload.get("rubric_scores", {}) if isinstance(report_payload.get("rubric_scores"), dict) else {}
-    normalized_rubric: Dict[str, int] = {}
-    for dim in RUBRIC_DIMENSIONS:
-        raw_value = rubric.get(dim, 0)
-        try:
-            value = int(raw_value)
-        except (TypeError, ValueError):
-            value = 0
-        normalized_rubric[dim] = max(0, min(100, value))
+    normalized_rubric: Dict[str, int] = {dim: _coerce_score(rubric.get(dim, 0)) for dim in RUBRIC_DIMENSIONS}
 
     if "overall_score" in report_payload:
         try:
@@ -222,7 +238,7 @@ def _normalize_report(payload: Dict, unit: CourseUnit, chunks: List[Dict[str, ob
             + normalized_rubric["revision_readiness"] * 0.15
         ))
 
-    overall = max(0, min(100, overall))
+    overall = _clamp100(overall)
 
     citation_fallback = f"p.{chunks[0]['page']}" if chunks else "p.0"
 
@@ -244,7 +260,7 @@ def _normalize_report(payload: Dict, unit: CourseUnit, chunks: List[Dict[str, ob
     line_notes = []
     if isinstance(raw_notes, list):
         for note in raw_notes[:6]:
-            if not isinstance(note, dict):
+            if type(note) is not dict:
                 continue
             line_notes.append(
                 LineNote(
@@ -0,0 +1,36 @@
+"""JSON encoding helpers shared by the cache files and the SQLite store."""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+import orjson
+
+
+def dumps(value: object) -> bytes:
+    """Serialize compactly; orjson encodes the dataclass models natively."""
+
+    return orjson.dumps(value)
+
+
+def dumps_text(value: object) -> str:
+    return orjson.dumps(value).decode("utf-8")
+
+
+def dumps_indented(value: object) -> bytes:
+    """Serialize with two-space indentation for files people are expected to edit."""
+
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+
+
+def loads(raw: str | bytes) -> object:
+    return orjson.loads(raw)
+
+
+def load_file(path: Path) -> object:
+    """Parse a JSON file, letting orjson read straight from a read-only memory map."""
+
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
@@ -6,6 +6,7 @@ import json
 import re
 from typing import Dict, List
 
+from . import jsonio
 from .config import (
     chunk_chars,
     data_dir,
@@ -19,6 +20,8 @@ from .types import CourseUnit, LessonIdea, LessonPack
 
 PACK_VERSION = 1
 _CITATION_RE = re.compile(r"^p\.(\d+)$")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_TERM_RE = re.compile(r"[a-z]{3,}")
 
 
 def _unit_cache_fingerprint(units: List[CourseUnit]) -> Dict[str, object]:
@@ -47,7 +50,7 @@ def _valid_citation(citation: str, valid_pages: set[int]) -> bool:
 
 
 def _safe_sentence(text: str, max_len: int = 170) -> str:
-    parts = [segment.strip() for segment in re.split(r"(?<=[.!?])\s+", text or "") if segment.strip()]
+    parts = [segment.strip() for segment in _SENTENCE_SPLIT_RE.split(text or "") if segment.strip()]
     sentence = parts[0] if parts else (text or "").strip()
     return sentence[:max_len].strip() or "Focus on how this unit handles craft choices."
 
@@ -56,13 +59,13 @@ def _chunk_rank(unit: CourseUnit, chunks: List[Dict[str, object]]) -> List[Dict[
     objective_terms = {
         token.lower()
         for objective in unit.learning_objectives
-        for token in re.findall(r"[a-z]{3,}", objective.lower())
+        for token in _TERM_RE.findall(objective.lower())
     }
 
     scored = []
     for chunk in chunks:
         text = str(chunk.get("text", ""))
-        tokens = set(re.findall(r"[a-z]{3,}", text.lower()))
+        tokens = set(_TERM_RE.findall(text.lower()))
         overlap = len(tokens.intersection(objective_terms))
         score = overlap * 6 + min(8, len(text) // 180)
         scored.append((score, chunk))
@@ -111,24 +114,27 @@ def _fallback_lesson_pack(unit: CourseUnit, chunks: List[Dict[str, object]]) ->
     first_page = int(first.get("page", unit.start_page or 1) or 1)
     summary = _safe_sentence(str(first.get("text", "")), max_len=320)
 
-    key_ideas: List[LessonIdea] = []
-    for idx in range(5):
-        source = ranked[idx % len(ranked)]
-        page = int(source.get("page", first_page) or first_page)
-        text = _safe_sentence(str(source.get("text", "")), max_len=175)
-        key_ideas.append(LessonIdea(text=text, citation=f"p.{page}"))
+    # Ideas and pitfalls only ever cite the top five ranked chunks: resolve each one's citation and
+    # lead sentence once, then fill both lists in a single pass.
+    sources = []
+    for chunk in ranked[:5]:
+        page = int(chunk.get("page", first_page) or first_page)
+        sources.append((f"p.{page}", _safe_sentence(str(chunk.get("text", "")), max_len=175)))
+    source_count = len(sources)
 
+    key_ideas: List[LessonIdea] = []
     pitfalls: List[LessonIdea] = []
-    for idx in range(3):
-        source = ranked[(idx + 1) % len(ranked)]
-        page = int(source.get("page", first_page) or first_page)
-        objective = unit.learning_objectives[idx % len(unit.learning_objectives)] if unit.learning_objectives else "the core technique"
-        pitfalls.append(
-            LessonIdea(
-                text=f"Do not replace {objective.lower()} with abstract summary; keep it visible in concrete scene action.",
-                citation=f"p.{page}",
+    for idx in range(5):
+        citation, text = sources[idx % source_count]
+        key_ideas.append(LessonIdea(text=text, citation=citation))
+        if idx < 3:
+            objective = unit.learning_objectives[idx % len(unit.learning_objectives)] if unit.learning_objectives else "the core technique"
+            pitfalls.append(
+                LessonIdea(
+                    text=f"Do not replace {objective.lower()} with abstract summary; keep it visible in concrete scene action.",
+                    citation=sources[(idx + 1) % source_count][0],
+                )
             )
-        )
 
     objectives = unit.learning_objectives or [f"Apply the key move in {unit.title}."]
     reflection_questions = [
@@ -204,7 +210,7 @@ def _normalize_idea_list(
     normalized: List[LessonIdea] = []
     if isinstance(raw_items, list):
         for item in raw_items:
-            if not isinstance(item, dict):
+            if type(item) is not dict:
                 continue
             text = str(item.get("text", "")).strip()
             citation = str(item.get("citation", "")).strip()
@@ -319,7 +325,7 @@ def _read_cached_packs() -> Dict[str, object]:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return jsonio.load_file(path)
     except Exception:
         return {}
 
@@ -336,19 +342,17 @@ def load_or_build_lesson_packs(
     if _cache_compatible(cached, units):
         raw_packs = cached.get("packs")
         if isinstance(raw_packs, list):
-            mapped: Dict[str, LessonPack] = {}
-            for item in raw_packs:
-                if not isinstance(item, dict):
-                    continue
-                pack = LessonPack.from_dict(item)
-                mapped[pack.unit_id] = pack
-            if set(mapped.keys()) == {unit.id for unit in units}:
-                valid = True
+            # Check unit coverage on the raw dicts so an incomplete cache is rejected before any
+            # LessonPack is built.
+            raw_by_unit = {str(item.get("unit_id", "")): item for item in raw_packs if type(item) is dict}
+            if raw_by_unit.keys() == {unit.id for unit in units}:
+                mapped: Dict[str, LessonPack] = {}
                 for unit in units:
-                    if not _pack_valid_for_unit(mapped[unit.id], unit):
-                        valid = False
+                    pack = LessonPack.from_dict(raw_by_unit[unit.id])
+                    if not _pack_valid_for_unit(pack, unit):
                         break
-                if valid:
+                    mapped[unit.id] = pack
+                else:
                     return mapped
 
     mapped: Dict[str, LessonPack] = {}
@@ -362,5 +366,5 @@ def load_or_build_lesson_packs(
         "pack_version": PACK_VERSION,
         "packs": [mapped[unit.id].to_dict() for unit in units],
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(jsonio.dumps(payload))
     return mapped
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-import json
 import re
 from typing import Dict, List
 
+from . import jsonio
 from .config import chunk_chars, data_dir, chunks_path, get_pdf_path
 from .types import CourseUnit
 
@@ -100,18 +100,17 @@ def _cache_compatible(payload: dict, pdf_path: Path, units: List[CourseUnit]) ->
 
     if not isinstance(payload, dict):
         return False
-    if payload.get("source_pdf") != pdf_path.name:
-        return False
-
-    cached_units = payload.get("unit_layout")
-    if cached_units != _unit_cache_fingerprint(units):
-        return False
 
+    # Cheap scalar checks first; the unit layout fingerprint is rebuilt and compared last.
     chunk_config = payload.get("chunk_config")
     if not isinstance(chunk_config, dict):
         return False
+    if chunk_config.get("max_chars") != chunk_chars():
+        return False
+    if payload.get("source_pdf") != pdf_path.name:
+        return False
 
-    return chunk_config.get("max_chars") == chunk_chars()
+    return payload.get("unit_layout") == _unit_cache_fingerprint(units)
 
 
 def _read_cached_chunks() -> Dict[str, object]:
@@ -121,7 +120,7 @@ def _read_cached_chunks() -> Dict[str, object]:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return jsonio.load_file(path)
     except Exception:
         return {}
 
@@ -137,10 +136,6 @@ def load_or_build_chunks(units: List[CourseUnit]) -> List[Dict[str, object]]:
     if _cache_compatible(cached, pdf_path, units):
         chunks = cached.get("chunks")
         if isinstance(chunks, list) and chunks:
-            for unit in units:
-                unit.source_chunks = [
-                    item["chunk_id"] for item in chunks if item.get("unit_id") == unit.id
-                ]
             return chunks  # type: ignore[return-value]
 
     pages = extract_page_texts(pdf_path)
@@ -149,7 +144,6 @@ def load_or_build_chunks(units: List[CourseUnit]) -> List[Dict[str, object]]:
     page_count = len(pages)
 
     for unit in units:
-        source_ids = []
         start = max(unit.start_page, 1)
         end = min(unit.end_page, page_count)
         for page_num in range(start, end + 1):
@@ -169,8 +163,6 @@ def load_or_build_chunks(units: List[CourseUnit]) -> List[Dict[str, object]]:
                         "chunk_index": chunk_index,
                     }
                 )
-                source_ids.append(chunk_id)
-        unit.source_chunks = source_ids
 
     payload = {
         "source_pdf": pdf_path.name,
@@ -179,11 +171,14 @@ def load_or_build_chunks(units: List[CourseUnit]) -> List[Dict[str, object]]:
         "generated_at": __import__("datetime").datetime.utcnow().isoformat(),
         "chunks": all_chunks,
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(jsonio.dumps(payload))
     return all_chunks
 
 
-def chunks_by_unit(unit: CourseUnit, chunks: List[Dict[str, object]]) -> List[Dict[str, object]]:
-    """Filter all chunks for a specific unit id."""
+def group_chunks_by_unit(chunks: List[Dict[str, object]]) -> Dict[str, List[Dict[str, object]]]:
+    """Index chunks by unit id in one pass, keeping their original order."""
 
-    return [chunk for chunk in chunks if chunk.get("unit_id") == unit.id]
+    grouped: Dict[str, List[Dict[str, object]]] = {}
+    for chunk in chunks:
+        grouped.setdefault(chunk.get("unit_id"), []).append(chunk)
+    return grouped
@@ -2,89 +2,362 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import logging
+import os
+import queue
 import sqlite3
+import sys
+import threading
+import time
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List
+from operator import itemgetter
+from typing import Dict, Iterator, List
 
+from . import jsonio
 from .config import db_path
 from .types import ChatTurn, FeedbackReport, ProgressRecord, RevisionMission
 
+logger = logging.getLogger(__name__)
+
+# Drafts at least this long are stored zlib-compressed in `drafts.draft_zlib`.
+_DRAFT_COMPRESS_MIN_CHARS = 512
+
+# Drafts are buffered per (db path, unit id) and written once they have been idle this long.
+_DRAFT_DEBOUNCE_SECONDS = 0.5
+_draft_lock = threading.Lock()
+_draft_timer: threading.Timer | None = None
+_pending_drafts: Dict[tuple[str, str], tuple[str, float]] = {}
+
+_OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+_optimize_lock = threading.Lock()
+_optimize_timer: threading.Timer | None = None
+
+_write_queue: "queue.Queue[tuple[str, str, tuple]]" = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+_schema_lock = threading.Lock()
+_initialized_db_files: set[tuple[str, int, int]] = set()
+_shared_lock = threading.Lock()
+_shared_connections: Dict[str, tuple[sqlite3.Connection, threading.RLock, tuple[str, int, int] | None]] = {}
+
 
 def _connection(path=None):
-    path = path or db_path()
-    conn = sqlite3.connect(str(path))
+    # Reads and synchronous writes must observe every write already handed to the writer thread.
+    flush_writes()
+    return _open_connection(path)
+
+
+@contextmanager
+def _db(path=None) -> Iterator[sqlite3.Connection]:
+    """Hold the process-wide connection to the database for the duration of the block.
+
+    Streamlit runs each rerun on a fresh thread, so all threads share one
+    connection per path and take turns through its lock.
+    """
+
+    flush_writes()
+    conn, lock = _shared_connection(str(path or db_path()))
+    with lock:
+        try:
+            yield conn
+        except BaseException:
+            # A failed statement must not leave the shared connection holding the write lock.
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+
+def _shared_connection(path: str) -> tuple[sqlite3.Connection, threading.RLock]:
+    file_id = _db_file_id(path)
+    with _shared_lock:
+        stale = _shared_connections.get(path)
+        if stale is not None and stale[2] == file_id:
+            return stale[0], stale[1]
+        # First use, or the file was deleted or replaced under the cached connection.
+        conn = _open_connection(path, check_same_thread=False)
+        lock = threading.RLock()
+        _shared_connections[path] = (conn, lock, _ensure_schema(conn, path))
+    if stale is not None:
+        _close_shared(stale[0], stale[1])
+    return conn, lock
+
+
+def _db_file_id(path: str) -> tuple[str, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_dev, stat.st_ino
+
+
+def _ensure_schema(conn: sqlite3.Connection, path: str) -> tuple[str, int, int] | None:
+    """Switch the database file to WAL and run `init_db` once per file, returning the file's identity.
+
+    Files are keyed by device and inode, so a database deleted or replaced at
+    the same path is set up again.
+    """
+
+    with _schema_lock:
+        file_id = _db_file_id(path)
+        if file_id is None or file_id not in _initialized_db_files:
+            # journal_mode is persisted in the database file, so it only needs setting once per file.
+            conn.execute("PRAGMA journal_mode=WAL")
+            init_db(conn)
+            file_id = _db_file_id(path)
+            _initialized_db_files.add(file_id)
+        return file_id
+
+
+def close_connections() -> None:
+    """Close the shared connection to every database."""
+
+    with _shared_lock:
+        entries = list(_shared_connections.values())
+        _shared_connections.clear()
+    for conn, lock, _file_id in entries:
+        _close_shared(conn, lock)
+
+
+def _close_shared(conn: sqlite3.Connection, lock: threading.RLock) -> None:
+    with lock:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            logger.exception("Failed to close database connection")
+
+
+def _open_connection(path=None, check_same_thread: bool = True):
+    path = str(path or db_path())
+    _start_optimize_timer()
+    conn = sqlite3.connect(path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    _configure_conn(conn)
     return conn
 
 
+def _configure_conn(conn: sqlite3.Connection) -> None:
+    """Use NORMAL sync with WAL so a commit costs one WAL append instead of a full journal fsync."""
+
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def _enqueue_write(sql: str, params: tuple, path=None) -> None:
+    """Hand a fire-and-forget write to the background writer thread."""
+
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="writer-course-db-writer", daemon=True)
+            _writer_thread.start()
+    _write_queue.put((str(path or db_path()), sql, params))
+
+
+def flush_writes() -> None:
+    """Block until every queued write has been committed."""
+
+    _write_queue.join()
+
+
+def _writer_loop() -> None:
+    connections: Dict[str, tuple[sqlite3.Connection, tuple[str, int, int] | None]] = {}
+    while True:
+        batch = [_write_queue.get()]
+        while True:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _apply_write_batch(connections, batch)
+        finally:
+            for _ in batch:
+                _write_queue.task_done()
+
+
+def _apply_write_batch(
+    connections: Dict[str, tuple[sqlite3.Connection, tuple[str, int, int] | None]],
+    batch: List[tuple[str, str, tuple]],
+) -> None:
+    """Apply queued writes with one transaction (and one fsync) per database.
+
+    Each statement runs under its own savepoint, so a failing write is rolled
+    back and logged without discarding the rest of the batch.
+    """
+
+    statements_by_path: Dict[str, List[tuple[str, tuple]]] = {}
+    for path, sql, params in batch:
+        statements_by_path.setdefault(path, []).append((sql, params))
+
+    for path, statements in statements_by_path.items():
+        try:
+            conn, file_id = connections.get(path, (None, None))
+            if conn is None or file_id != _db_file_id(path):
+                if conn is not None:
+                    conn.close()
+                conn = _open_connection(path)
+                connections[path] = (conn, _ensure_schema(conn, path))
+            with conn:
+                conn.execute("BEGIN")
+                for sql, params in statements:
+                    conn.execute("SAVEPOINT queued_write")
+                    try:
+                        conn.execute(sql, params)
+                    except sqlite3.Error:
+                        conn.execute("ROLLBACK TO queued_write")
+                        logger.exception("Dropped queued write to %s: %s", path, sql)
+                    conn.execute("RELEASE queued_write")
+        except Exception:
+            logger.exception("Dropped %d queued writes to %s", len(statements), path)
+
+
+def _start_optimize_timer() -> None:
+    with _optimize_lock:
+        if _optimize_timer is None:
+            _schedule_optimize()
+
+
+def _schedule_optimize() -> None:
+    global _optimize_timer
+    _optimize_timer = threading.Timer(_OPTIMIZE_INTERVAL_SECONDS, _periodic_optimize)
+    _optimize_timer.daemon = True
+    _optimize_timer.start()
+
+
+def _periodic_optimize() -> None:
+    optimize_db()
+    with _optimize_lock:
+        _schedule_optimize()
+
+
+def optimize_db() -> None:
+    """Run `PRAGMA optimize` on the shared connection to every open database.
+
+    Before SQLite 3.46 the pragma only analyzes tables the running connection
+    has queried, so it must run on the long-lived connections, not a fresh one.
+    """
+
+    with _shared_lock:
+        entries = list(_shared_connections.values())
+    for conn, lock, _file_id in entries:
+        with lock:
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                logger.exception("PRAGMA optimize failed")
+
+
+# atexit runs handlers last-registered first: flush queued writes, optimize, then close.
+atexit.register(close_connections)
+atexit.register(optimize_db)
+atexit.register(flush_writes)
+
+
 def _table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
     rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
     return {str(row["name"]) for row in rows}
 
 
-def _ensure_column(conn: sqlite3.Connection, table: str, column_definition: str) -> None:
-    column_name = column_definition.split()[0]
-    if column_name in _table_columns(conn, table):
+def _ensure_columns(conn: sqlite3.Connection, table: str, column_definitions: List[str]) -> None:
+    existing = _table_columns(conn, table)
+    for column_definition in column_definitions:
+        if column_definition.split()[0] not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_definition}")
+
+
+def _drop_columns(conn: sqlite3.Connection, table: str, column_names: List[str], table_sql: str) -> None:
+    existing = _table_columns(conn, table)
+    stale = [column_name for column_name in column_names if column_name in existing]
+    if not stale:
+        return
+    if sqlite3.sqlite_version_info >= (3, 35, 0):
+        for column_name in stale:
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN {column_name}")
         return
-    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_definition}")
+
+    # SQLite before 3.35 has no DROP COLUMN: rebuild the table from `table_sql` and copy the kept columns.
+    kept = ", ".join(sorted(existing.difference(stale)))
+    try:
+        conn.executescript(
+            f"""
+            BEGIN;
+            ALTER TABLE {table} RENAME TO {table}_legacy;
+            {table_sql}
+            INSERT INTO {table} ({kept}) SELECT {kept} FROM {table}_legacy;
+            DROP TABLE {table}_legacy;
+            COMMIT;
+            """
+        )
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+
+_PROGRESS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS progress (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    current_unit_id TEXT NOT NULL,
+    unlocked_units TEXT NOT NULL,
+    last_opened_at TEXT NOT NULL
+);
+"""
+
+_SCHEMA_SQL = _PROGRESS_TABLE_SQL + """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    unit_id TEXT NOT NULL,
+    draft TEXT NOT NULL,
+    overall_score INTEGER NOT NULL,
+    feedback_json TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS drafts (
+    unit_id TEXT PRIMARY KEY,
+    draft TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS chat_turns (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    unit_id TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    citations TEXT
+);
+
+CREATE TABLE IF NOT EXISTS revision_missions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    unit_id TEXT NOT NULL,
+    attempt_id INTEGER NOT NULL,
+    focus_dimension TEXT NOT NULL,
+    title TEXT NOT NULL,
+    instructions TEXT NOT NULL,
+    checklist_json TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    completed_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_attempts_unit_id ON attempts (unit_id);
+CREATE INDEX IF NOT EXISTS idx_chat_turns_unit_id ON chat_turns (unit_id);
+CREATE INDEX IF NOT EXISTS idx_revision_missions_unit_status ON revision_missions (unit_id, status);
+"""
 
 
 def init_db(conn=None):
     conn = conn or _connection()
-    conn.executescript(
-        """
-        CREATE TABLE IF NOT EXISTS progress (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            current_unit_id TEXT NOT NULL,
-            unlocked_units TEXT NOT NULL,
-            attempts TEXT NOT NULL,
-            best_score_by_unit TEXT NOT NULL,
-            last_opened_at TEXT NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS attempts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            unit_id TEXT NOT NULL,
-            draft TEXT NOT NULL,
-            overall_score INTEGER NOT NULL,
-            feedback_json TEXT NOT NULL,
-            created_at TEXT NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS drafts (
-            unit_id TEXT PRIMARY KEY,
-            draft TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS chat_turns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            unit_id TEXT NOT NULL,
-            question TEXT NOT NULL,
-            answer TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            citations TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS revision_missions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            unit_id TEXT NOT NULL,
-            attempt_id INTEGER NOT NULL,
-            focus_dimension TEXT NOT NULL,
-            title TEXT NOT NULL,
-            instructions TEXT NOT NULL,
-            checklist_json TEXT NOT NULL,
-            status TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            completed_at TEXT
-        );
-        """
-    )
+    conn.executescript(_SCHEMA_SQL)
 
     # Migration-safe additions for existing DBs.
-    _ensure_column(conn, "chat_turns", "evidence_json TEXT")
-    _ensure_column(conn, "chat_turns", "confidence REAL")
+    _ensure_columns(conn, "chat_turns", ["evidence_json TEXT", "confidence REAL"])
+    _ensure_columns(conn, "drafts", ["draft_zlib BLOB"])
+
+    # Attempt counts and best scores are derived from `attempts`; drop the legacy JSON copies.
+    _drop_columns(conn, "progress", ["attempts", "best_score_by_unit"], _PROGRESS_TABLE_SQL)
 
     conn.commit()
 
@@ -100,21 +373,37 @@ def _default_progress(unit_ids: List[str]) -> ProgressRecord:
     )
 
 
+def _attempt_stats(conn: sqlite3.Connection) -> tuple[Dict[str, int], Dict[str, int]]:
+    """Derive per-unit attempt counts and best scores from the `attempts` table."""
+
+    rows = conn.execute(
+        "SELECT unit_id, COUNT(*) AS attempt_count, MAX(overall_score) AS best_score FROM attempts GROUP BY unit_id"
+    ).fetchall()
+    # Interned ids let both dicts (and unlocked_units) share one string object per unit.
+    unit_ids = [sys.intern(str(row["unit_id"])) for row in rows]
+    attempts = {unit_id: int(row["attempt_count"]) for unit_id, row in zip(unit_ids, rows)}
+    best_score_by_unit = {unit_id: int(row["best_score"]) for unit_id, row in zip(unit_ids, rows)}
+    return attempts, best_score_by_unit
+
+
 def load_progress(unit_ids: List[str]) -> ProgressRecord:
-    conn = _connection()
-    init_db(conn)
-    row = conn.execute("SELECT * FROM progress WHERE id = 1").fetchone()
+    with _db() as conn:
+        row = conn.execute(
+            "SELECT current_unit_id, unlocked_units, last_opened_at FROM progress WHERE id = 1"
+        ).fetchone()
+        attempts, best_score_by_unit = _attempt_stats(conn)
     if row is None:
         progress = _default_progress(unit_ids)
-        persist_progress(progress, conn=conn)
-        conn.close()
+        progress.attempts = attempts
+        progress.best_score_by_unit = best_score_by_unit
+        persist_progress(progress)
         return progress
 
     progress = ProgressRecord(
         current_unit_id=row["current_unit_id"],
-        unlocked_units=json.loads(row["unlocked_units"]),
-        attempts=json.loads(row["attempts"]),
-        best_score_by_unit=json.loads(row["best_score_by_unit"]),
+        unlocked_units=[sys.intern(unit_id) for unit_id in jsonio.loads(row["unlocked_units"])],
+        attempts=attempts,
+        best_score_by_unit=best_score_by_unit,
         last_opened_at=row["last_opened_at"],
     )
 
@@ -128,37 +417,41 @@ def load_progress(unit_ids: List[str]) -> ProgressRecord:
         progress.current_unit_id = progress.unlocked_units[0]
 
     progress.last_opened_at = datetime.utcnow().isoformat()
-    persist_progress(progress, conn=conn)
-    conn.close()
+    persist_progress(progress)
     return progress
 
 
 def persist_progress(progress: ProgressRecord, conn=None) -> None:
-    """Persist the progress envelope back to SQLite."""
+    """Persist the progress envelope back to SQLite.
 
-    conn = conn or _connection()
-    init_db(conn)
-    payload = progress.to_dict()
+    Attempt counts and best scores are not stored here; they are derived from
+    the `attempts` table on load.
+    """
+
+    if conn is not None:
+        with conn:
+            _upsert_progress(conn, progress)
+        return
+    with _db() as conn, conn:
+        _upsert_progress(conn, progress)
+
+
+def _upsert_progress(conn: sqlite3.Connection, progress: ProgressRecord) -> None:
     conn.execute(
         """
-        INSERT INTO progress (id, current_unit_id, unlocked_units, attempts, best_score_by_unit, last_opened_at)
-        VALUES (1, :current_unit_id, :unlocked_units, :attempts, :best_score_by_unit, :last_opened_at)
+        INSERT INTO progress (id, current_unit_id, unlocked_units, last_opened_at)
+        VALUES (1, :current_unit_id, :unlocked_units, :last_opened_at)
         ON CONFLICT(id) DO UPDATE SET
             current_unit_id = excluded.current_unit_id,
             unlocked_units = excluded.unlocked_units,
-            attempts = excluded.attempts,
-            best_score_by_unit = excluded.best_score_by_unit,
             last_opened_at = excluded.last_opened_at;
         """,
         {
-            "current_unit_id": payload["current_unit_id"],
-            "unlocked_units": json.dumps(payload["unlocked_units"]),
-            "attempts": json.dumps(payload["attempts"]),
-            "best_score_by_unit": json.dumps(payload["best_score_by_unit"]),
-            "last_opened_at": payload["last_opened_at"],
+            "current_unit_id": progress.current_unit_id,
+            "unlocked_units": jsonio.dumps_text(progress.unlocked_units),
+            "last_opened_at": progress.last_opened_at,
         },
     )
-    conn.commit()
 
 
 def set_current_unit(progress: ProgressRecord, unit_id: str) -> ProgressRecord:
@@ -170,11 +463,9 @@ def set_current_unit(progress: ProgressRecord, unit_id: str) -> ProgressRecord:
     return progress
 
 
-def _next_unit_id(unit_id: str, all_units: List[str]) -> str | None:
-    if unit_id not in all_units:
-        return None
-    idx = all_units.index(unit_id)
-    if idx + 1 >= len(all_units):
+def _next_unit_id(unit_id: str, all_units: List[str], positions: Dict[str, int]) -> str | None:
+    idx = positions.get(unit_id)
+    if idx is None or idx + 1 >= len(all_units):
         return None
     return all_units[idx + 1]
 
@@ -188,29 +479,30 @@ def add_feedback_attempt_with_id(
 ) -> tuple[ProgressRecord, int]:
     """Record an attempt and return updated progress with inserted attempt id."""
 
-    conn = _connection()
-    init_db(conn)
     now = datetime.utcnow().isoformat()
-    cursor = conn.execute(
-        "INSERT INTO attempts (unit_id, draft, overall_score, feedback_json, created_at) VALUES (?, ?, ?, ?, ?)",
-        (unit_id, draft, report.overall_score, json.dumps(report.to_dict()), now),
-    )
+    # The attempt insert and the progress upsert share one transaction, so one commit per attempt.
+    with _db() as conn, conn:
+        cursor = conn.execute(
+            "INSERT INTO attempts (unit_id, draft, overall_score, feedback_json, created_at) VALUES (?, ?, ?, ?, ?)",
+            (unit_id, draft, report.overall_score, jsonio.dumps_text(report), now),
+        )
 
-    progress.attempts[unit_id] = progress.attempts.get(unit_id, 0) + 1
-    progress.best_score_by_unit[unit_id] = max(
-        progress.best_score_by_unit.get(unit_id, 0), report.overall_score
-    )
+        stats = conn.execute(
+            "SELECT COUNT(*) AS attempt_count, MAX(overall_score) AS best_score FROM attempts WHERE unit_id = ?",
+            (unit_id,),
+        ).fetchone()
+        unit_id = sys.intern(unit_id)
+        progress.attempts[unit_id] = int(stats["attempt_count"])
+        progress.best_score_by_unit[unit_id] = int(stats["best_score"])
 
-    if unit_id in all_unit_ids:
-        nxt = _next_unit_id(unit_id, all_unit_ids)
+        positions = {uid: idx for idx, uid in enumerate(all_unit_ids)}
+        nxt = _next_unit_id(unit_id, all_unit_ids, positions)
         if nxt and nxt not in progress.unlocked_units:
             progress.unlocked_units.append(nxt)
-            progress.unlocked_units.sort(key=lambda x: all_unit_ids.index(x))
+            progress.unlocked_units.sort(key=positions.__getitem__)
 
-    progress.last_opened_at = now
-    persist_progress(progress, conn=conn)
-    conn.commit()
-    conn.close()
+        progress.last_opened_at = now
+        _upsert_progress(conn, progress)
     attempt_id = int(cursor.lastrowid or 0)
     return progress, attempt_id
 
@@ -234,69 +526,126 @@ def add_feedback_attempt(
     return progress
 
 
-def save_draft(unit_id: str, text: str) -> None:
-    """Persist draft text for a unit in the `drafts` table."""
-
-    conn = _connection()
-    init_db(conn)
+def _enqueue_draft(path: str, unit_id: str, text: str) -> None:
     now = datetime.utcnow().isoformat()
-    conn.execute(
-        "INSERT INTO drafts (unit_id, draft, updated_at) VALUES (?, ?, ?)"
-        " ON CONFLICT(unit_id) DO UPDATE SET draft=excluded.draft, updated_at=excluded.updated_at",
-        (unit_id, text, now),
+    if len(text) >= _DRAFT_COMPRESS_MIN_CHARS:
+        draft, draft_zlib = "", zlib.compress(text.encode("utf-8"), 6)
+    else:
+        draft, draft_zlib = text, None
+    _enqueue_write(
+        "INSERT INTO drafts (unit_id, draft, draft_zlib, updated_at) VALUES (?, ?, ?, ?)"
+        " ON CONFLICT(unit_id) DO UPDATE SET"
+        " draft=excluded.draft, draft_zlib=excluded.draft_zlib, updated_at=excluded.updated_at",
+        (unit_id, draft, draft_zlib, now),
+        path=path,
     )
-    conn.commit()
-    conn.close()
+
+
+def _schedule_draft_flush() -> None:
+    # Caller holds `_draft_lock`.
+    global _draft_timer
+    if _draft_timer is None:
+        _draft_timer = threading.Timer(_DRAFT_DEBOUNCE_SECONDS, _flush_idle_drafts)
+        _draft_timer.daemon = True
+        _draft_timer.start()
+
+
+def _flush_idle_drafts() -> None:
+    global _draft_timer
+    with _draft_lock:
+        _draft_timer = None
+        cutoff = time.monotonic() - _DRAFT_DEBOUNCE_SECONDS
+        idle = [key for key, (_text, saved_at) in _pending_drafts.items() if saved_at <= cutoff]
+        for path, unit_id in idle:
+            text, _saved_at = _pending_drafts.pop((path, unit_id))
+            _enqueue_draft(path, unit_id, text)
+        if _pending_drafts:
+            _schedule_draft_flush()
+
+
+def flush_drafts() -> None:
+    """Write every buffered draft now and wait for the writes to commit."""
+
+    with _draft_lock:
+        for (path, unit_id), (text, _saved_at) in _pending_drafts.items():
+            _enqueue_draft(path, unit_id, text)
+        _pending_drafts.clear()
+    flush_writes()
+
+
+atexit.register(flush_drafts)
+
+
+def save_draft(unit_id: str, text: str) -> None:
+    """Buffer draft text for a unit; it is written to `drafts` once idle for the debounce window."""
+
+    with _draft_lock:
+        _pending_drafts[(str(db_path()), unit_id)] = (text, time.monotonic())
+        _schedule_draft_flush()
 
 
 def get_draft(unit_id: str) -> str:
     """Load persisted draft for a unit."""
 
-    conn = _connection()
-    init_db(conn)
-    row = conn.execute("SELECT draft FROM drafts WHERE unit_id = ?", (unit_id,)).fetchone()
-    conn.close()
+    with _draft_lock:
+        pending = _pending_drafts.get((str(db_path()), unit_id))
+    if pending is not None:
+        return pending[0]
+
+    with _db() as conn:
+        row = conn.execute("SELECT draft, draft_zlib FROM drafts WHERE unit_id = ?", (unit_id,)).fetchone()
     if row is None:
         return ""
+    if row["draft_zlib"] is not None:
+        return zlib.decompress(row["draft_zlib"]).decode("utf-8")
     return row["draft"]
 
 
 def get_attempts_for_unit(unit_id: str, limit: int | None = None) -> List[Dict[str, object]]:
     """Fetch attempt rows for a unit, newest first."""
 
-    conn = _connection()
-    init_db(conn)
     q = "SELECT id, unit_id, draft, overall_score, feedback_json, created_at FROM attempts WHERE unit_id = ? ORDER BY id DESC"
     if limit:
         q += f" LIMIT {int(limit)}"
-    rows = conn.execute(q, (unit_id,)).fetchall()
-    conn.close()
+    with _db() as conn:
+        rows = conn.execute(q, (unit_id,)).fetchall()
     return [dict(row) for row in rows]
 
 
+def _latest_feedback_json(unit_id: str) -> str | None:
+    with _db() as conn:
+        row = conn.execute(
+            "SELECT feedback_json FROM attempts WHERE unit_id = ? ORDER BY id DESC LIMIT 1",
+            (unit_id,),
+        ).fetchone()
+    return None if row is None else row["feedback_json"]
+
+
 def get_latest_feedback_for_unit(unit_id: str) -> FeedbackReport | None:
     """Return latest attempt feedback for a unit, if present."""
 
-    attempts = get_attempts_for_unit(unit_id, limit=1)
-    if not attempts:
+    raw = _latest_feedback_json(unit_id)
+    if raw is None:
         return None
-    return FeedbackReport.from_dict(json.loads(attempts[0]["feedback_json"]))
+    return FeedbackReport.from_dict(jsonio.loads(raw))
 
 
-def _serialize_evidence(evidence: List[dict] | None) -> str:
-    return json.dumps(evidence or [])
+def _serialize_json_list(values: List[object] | None) -> str | None:
+    # Empty lists are stored as NULL; `_deserialize_json_list` reads NULL back as [].
+    return jsonio.dumps_text(values) if values else None
 
 
 def _deserialize_json_list(raw: object) -> List[object]:
     if raw is None:
         return []
-    if isinstance(raw, list):
+    raw_type = type(raw)
+    if raw_type is list:
         return raw
-    if not isinstance(raw, str) or not raw.strip():
+    if raw_type is not str or not raw.strip():
         return []
     try:
-        value = json.loads(raw)
-        return value if isinstance(value, list) else []
+        value = jsonio.loads(raw)
+        return value if type(value) is list else []
     except Exception:
         return []
 
@@ -309,41 +658,35 @@ def save_chat_turn(
     evidence: List[dict] | None = None,
     confidence: float | None = None,
 ) -> None:
-    """Persist a coach interaction turn."""
+    """Queue a coach interaction turn (committed by the writer thread)."""
 
-    conn = _connection()
-    init_db(conn)
-    citations_json = json.dumps(citations or [])
-    evidence_json = _serialize_evidence(evidence)
+    citations_json = _serialize_json_list(citations)
+    evidence_json = _serialize_json_list(evidence)
     now = datetime.utcnow().isoformat()
-    conn.execute(
+    _enqueue_write(
         "INSERT INTO chat_turns (unit_id, question, answer, created_at, citations, evidence_json, confidence) VALUES (?, ?, ?, ?, ?, ?, ?)",
         (unit_id, question, answer, now, citations_json, evidence_json, confidence),
     )
-    conn.commit()
-    conn.close()
 
 
 def get_chat_turns(unit_id: str, limit: int | None = None) -> List[Dict[str, object]]:
     """Fetch recent coach turns for a unit, newest first."""
 
-    conn = _connection()
-    init_db(conn)
     q = (
         "SELECT question, answer, created_at, citations, evidence_json, confidence "
         "FROM chat_turns WHERE unit_id = ? ORDER BY id DESC"
     )
     if limit:
         q += f" LIMIT {int(limit)}"
-    rows = conn.execute(q, (unit_id,)).fetchall()
-    conn.close()
+    with _db() as conn:
+        rows = conn.execute(q, (unit_id,)).fetchall()
 
     payload: List[Dict[str, object]] = []
     for row in rows:
         item = dict(row)
         item["citations"] = [str(value) for value in _deserialize_json_list(item.get("citations"))]
         evidence_list = _deserialize_json_list(item.get("evidence_json"))
-        item["evidence"] = [value for value in evidence_list if isinstance(value, dict)]
+        item["evidence"] = [value for value in evidence_list if type(value) is dict]
         payload.append(item)
     return payload
 
@@ -351,56 +694,50 @@ def get_chat_turns(unit_id: str, limit: int | None = None) -> List[Dict[str, obj
 def save_revision_mission(mission: RevisionMission) -> RevisionMission:
     """Insert or update a revision mission and return the persisted model."""
 
-    conn = _connection()
-    init_db(conn)
-    payload = mission.to_dict()
-    checklist_json = json.dumps(payload.get("checklist", []))
-
-    if mission.id is None:
-        cursor = conn.execute(
-            """
-            INSERT INTO revision_missions (
-                unit_id, attempt_id, focus_dimension, title, instructions, checklist_json,
-                status, created_at, completed_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                mission.unit_id,
-                mission.attempt_id,
-                mission.focus_dimension,
-                mission.title,
-                mission.instructions,
-                checklist_json,
-                mission.status,
-                mission.created_at,
-                mission.completed_at,
-            ),
-        )
-        mission.id = int(cursor.lastrowid or 0)
-    else:
-        conn.execute(
-            """
-            UPDATE revision_missions
-            SET unit_id = ?, attempt_id = ?, focus_dimension = ?, title = ?,
-                instructions = ?, checklist_json = ?, status = ?, created_at = ?, completed_at = ?
-            WHERE id = ?
-            """,
-            (
-                mission.unit_id,
-                mission.attempt_id,
-                mission.focus_dimension,
-                mission.title,
-                mission.instructions,
-                checklist_json,
-                mission.status,
-                mission.created_at,
-                mission.completed_at,
-                mission.id,
-            ),
-        )
-
-    conn.commit()
-    conn.close()
+    checklist_json = jsonio.dumps_text(mission.checklist)
+    with _db() as conn, conn:
+        if mission.id is None:
+            cursor = conn.execute(
+                """
+                INSERT INTO revision_missions (
+                    unit_id, attempt_id, focus_dimension, title, instructions, checklist_json,
+                    status, created_at, completed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    mission.unit_id,
+                    mission.attempt_id,
+                    mission.focus_dimension,
+                    mission.title,
+                    mission.instructions,
+                    checklist_json,
+                    mission.status,
+                    mission.created_at,
+                    mission.completed_at,
+                ),
+            )
+            mission.id = int(cursor.lastrowid or 0)
+        else:
+            conn.execute(
+                """
+                UPDATE revision_missions
+                SET unit_id = ?, attempt_id = ?, focus_dimension = ?, title = ?,
+                    instructions = ?, checklist_json = ?, status = ?, created_at = ?, completed_at = ?
+                WHERE id = ?
+                """,
+                (
+                    mission.unit_id,
+                    mission.attempt_id,
+                    mission.focus_dimension,
+                    mission.title,
+                    mission.instructions,
+                    checklist_json,
+                    mission.status,
+                    mission.created_at,
+                    mission.completed_at,
+                    mission.id,
+                ),
+            )
     return mission
 
 
@@ -422,37 +759,31 @@ def _mission_from_row(row: sqlite3.Row) -> RevisionMission:
 def get_active_revision_mission(unit_id: str) -> RevisionMission | None:
     """Return the latest active revision mission for one unit."""
 
-    conn = _connection()
-    init_db(conn)
-    row = conn.execute(
-        """
-        SELECT id, unit_id, attempt_id, focus_dimension, title, instructions,
-               checklist_json, status, created_at, completed_at
-        FROM revision_missions
-        WHERE unit_id = ? AND status = 'active'
-        ORDER BY id DESC
-        LIMIT 1
-        """,
-        (unit_id,),
-    ).fetchone()
-    conn.close()
+    with _db() as conn:
+        row = conn.execute(
+            """
+            SELECT id, unit_id, attempt_id, focus_dimension, title, instructions,
+                   checklist_json, status, created_at, completed_at
+            FROM revision_missions
+            WHERE unit_id = ? AND status = 'active'
+            ORDER BY id DESC
+            LIMIT 1
+            """,
+            (unit_id,),
+        ).fetchone()
     if row is None:
         return None
     return _mission_from_row(row)
 
 
 def complete_revision_mission(mission_id: int) -> None:
-    """Mark one revision mission as completed."""
+    """Queue marking one revision mission as completed."""
 
-    conn = _connection()
-    init_db(conn)
     now = datetime.utcnow().isoformat()
-    conn.execute(
+    _enqueue_write(
         "UPDATE revision_missions SET status = 'completed', completed_at = ? WHERE id = ?",
         (now, mission_id),
     )
-    conn.commit()
-    conn.close()
 
 
 def supersede_active_revision_missions(unit_id: str, new_attempt_id: int) -> int:
@@ -460,31 +791,26 @@ def supersede_active_revision_missions(unit_id: str, new_attempt_id: int) -> int
 
     _ = new_attempt_id  # Explicitly keep API intention for audit/debug call sites.
 
-    conn = _connection()
-    init_db(conn)
     now = datetime.utcnow().isoformat()
-    cursor = conn.execute(
-        """
-        UPDATE revision_missions
-        SET status = 'superseded', completed_at = ?
-        WHERE unit_id = ? AND status = 'active'
-        """,
-        (now, unit_id),
-    )
-    conn.commit()
-    conn.close()
+    with _db() as conn, conn:
+        cursor = conn.execute(
+            """
+            UPDATE revision_missions
+            SET status = 'superseded', completed_at = ?
+            WHERE unit_id = ? AND status = 'active'
+            """,
+            (now, unit_id),
+        )
     return int(cursor.rowcount or 0)
 
 
 def get_all_attempts() -> List[Dict[str, object]]:
     """Fetch all attempts across all units."""
 
-    conn = _connection()
-    init_db(conn)
-    rows = conn.execute(
-        "SELECT id, unit_id, overall_score, created_at FROM attempts ORDER BY id DESC"
-    ).fetchall()
-    conn.close()
+    with _db() as conn:
+        rows = conn.execute(
+            "SELECT id, unit_id, overall_score, created_at FROM attempts ORDER BY id DESC"
+        ).fetchall()
     return [dict(row) for row in rows]
 
 
@@ -494,32 +820,35 @@ def export_portfolio(unit_ids: List[str]) -> Dict[str, object]:
     unit_set = set(unit_ids)
     progress = load_progress(unit_ids)
 
-    conn = _connection()
-    init_db(conn)
     if unit_ids:
-        rows = conn.execute(
-            "SELECT id, unit_id, draft, overall_score, feedback_json, created_at FROM attempts WHERE unit_id IN ({}) ORDER BY created_at ASC".format(
-                ",".join("?" for _ in unit_ids)
-            ),
-            unit_ids,
-        ).fetchall()
+        # One JSON-array parameter keeps the statement text fixed and avoids the bound-variable limit.
+        # SQLite assembles each unit's attempts (with the feedback embedded) into one JSON array.
+        with _db() as conn:
+            rows = conn.execute(
+                """
+                SELECT a.unit_id,
+                       json_group_array(json_object(
+                           'id', a.id,
+                           'draft', a.draft,
+                           'overall_score', a.overall_score,
+                           'feedback', json(a.feedback_json),
+                           'created_at', a.created_at
+                       )) AS attempts_json
+                FROM attempts a
+                JOIN (SELECT DISTINCT value FROM json_each(?)) u ON a.unit_id = u.value
+                GROUP BY a.unit_id
+                """,
+                (jsonio.dumps_text(unit_ids),),
+            ).fetchall()
     else:
         rows = []
-    conn.close()
 
     attempts_by_unit: Dict[str, List[Dict[str, object]]] = {unit_id: [] for unit_id in unit_set}
     for row in rows:
-        unit_id = row["unit_id"]
-        if unit_id in unit_set:
-            attempts_by_unit.setdefault(unit_id, []).append(
-                {
-                    "id": row["id"],
-                    "draft": row["draft"],
-                    "overall_score": row["overall_score"],
-                    "feedback": json.loads(row["feedback_json"]),
-                    "created_at": row["created_at"],
-                }
-            )
+        attempts = jsonio.loads(row["attempts_json"])
+        # Element order inside json_group_array is unspecified before SQLite 3.44, so sort here; id breaks ties.
+        attempts.sort(key=itemgetter("created_at", "id"))
+        attempts_by_unit[row["unit_id"]] = attempts
 
     ordered_units = [
         {
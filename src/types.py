@@ -2,12 +2,92 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+_REQUIRED = object()
+_UTC_NOW = object()
 
-@dataclass
+
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _make_from_dict(class_name: str, spec: List[Tuple[str, Callable[[Any], Any] | None, Any]]) -> classmethod:
+    """Compile a ``from_dict`` classmethod that builds the instance in one constructor call.
+
+    Each ``spec`` row is ``(field_name, coerce, default)``. ``coerce=None`` passes the value
+    through, ``default=_REQUIRED`` reads the key with ``payload[...]`` and ``default=_UTC_NOW``
+    falls back to the current UTC timestamp only when the key is missing or ``None``. A ``None``
+    default keeps missing/``None`` values as ``None`` and only coerces real values; the key is
+    looked up once and bound to a local.
+    """
+
+    namespace: Dict[str, Any] = {"_now_iso": _now_iso}
+    arguments = []
+    for idx, (name, coerce, default) in enumerate(spec):
+        call = f"_c{idx}" if coerce is not None else ""
+        if coerce is not None:
+            namespace[call] = coerce
+        if default is _REQUIRED:
+            value = f"{call}(p[{name!r}])"
+        elif default is _UTC_NOW:
+            value = f"{call}(_v{idx} if (_v{idx} := p.get({name!r})) is not None else _now_iso())"
+        elif default is None and coerce is not None:
+            value = f"({call}(_v{idx}) if (_v{idx} := p.get({name!r})) is not None else None)"
+        else:
+            namespace[f"_d{idx}"] = default
+            value = f"{call}(p.get({name!r}, _d{idx}))"
+        arguments.append(f"        {name}={value},")
+
+    source = "\n".join(
+        ["def from_dict(cls, payload):", "    p = payload or {}", "    return cls(", *arguments, "    )"]
+    )
+    exec(compile(source, f"<{class_name}.from_dict>", "exec"), namespace)
+    from_dict = namespace["from_dict"]
+    from_dict.__qualname__ = f"{class_name}.from_dict"
+    return classmethod(from_dict)
+
+
+def _str_list(values: Any) -> List[str]:
+    return [str(item) for item in values]
+
+
+def _int_dict(values: Any) -> Dict[str, int]:
+    return {k: int(v) for k, v in values.items()}
+
+
+def _float_or_zero(value: Any) -> float:
+    return float(value or 0.0)
+
+
+def _model_list(items: Any, model: type) -> List[Any]:
+    """Coerce a nested list to ``model`` instances, keeping items that are already typed.
+
+    One pass with exact ``type(...) is`` checks; items that are neither ``model`` nor ``dict``
+    are dropped.
+    """
+
+    typed: List[Any] = []
+    for item in items:
+        item_type = type(item)
+        if item_type is model:
+            typed.append(item)
+        elif item_type is dict:
+            typed.append(model.from_dict(item))
+    return typed
+
+
+_LINE_NOTE_CONVERTERS = [
+    ("line_number", int, 0),
+    ("text_excerpt", str, ""),
+    ("comment", str, ""),
+    ("citation", None, None),
+]
+
+
+@dataclass(slots=True)
 class LineNote:
     """Line-level feedback note."""
 
@@ -17,21 +97,31 @@ class LineNote:
     citation: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "line_number": self.line_number,
+            "text_excerpt": self.text_excerpt,
+            "comment": self.comment,
+            "citation": self.citation,
+        }
+
+    from_dict = _make_from_dict("LineNote", _LINE_NOTE_CONVERTERS)
+
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "LineNote":
-        if payload is None:
-            return cls(line_number=0, text_excerpt="", comment="")
-        return cls(
-            line_number=int(payload.get("line_number", 0)),
-            text_excerpt=str(payload.get("text_excerpt", "")),
-            comment=str(payload.get("comment", "")),
-            citation=payload.get("citation"),
-        )
+def _line_note_list(items: Any) -> List[LineNote]:
+    return _model_list(items, LineNote)
 
 
-@dataclass
+_COURSE_UNIT_CONVERTERS = [
+    ("id", str, _REQUIRED),
+    ("title", str, _REQUIRED),
+    ("start_page", int, _REQUIRED),
+    ("end_page", int, _REQUIRED),
+    ("learning_objectives", list, []),
+    ("source_chunks", list, []),
+]
+
+
+@dataclass(slots=True, frozen=True)
 class CourseUnit:
     id: str
     title: str
@@ -41,21 +131,29 @@ class CourseUnit:
     source_chunks: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "start_page": self.start_page,
+            "end_page": self.end_page,
+            "learning_objectives": list(self.learning_objectives),
+            "source_chunks": list(self.source_chunks),
+        }
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "CourseUnit":
-        return cls(
-            id=str(payload["id"]),
-            title=str(payload["title"]),
-            start_page=int(payload["start_page"]),
-            end_page=int(payload["end_page"]),
-            learning_objectives=list(payload.get("learning_objectives", [])),
-            source_chunks=list(payload.get("source_chunks", [])),
-        )
+    from_dict = _make_from_dict("CourseUnit", _COURSE_UNIT_CONVERTERS)
 
 
-@dataclass
+_EXERCISE_SPEC_CONVERTERS = [
+    ("unit_id", str, _REQUIRED),
+    ("source_mode", str, _REQUIRED),
+    ("prompt", str, _REQUIRED),
+    ("success_criteria", list, []),
+    ("timebox_minutes", int, _REQUIRED),
+    ("kind", str, "core"),
+]
+
+
+@dataclass(slots=True)
 class ExerciseSpec:
     unit_id: str
     source_mode: str
@@ -65,39 +163,48 @@ class ExerciseSpec:
     kind: str = "core"
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "unit_id": self.unit_id,
+            "source_mode": self.source_mode,
+            "prompt": self.prompt,
+            "success_criteria": list(self.success_criteria),
+            "timebox_minutes": self.timebox_minutes,
+            "kind": self.kind,
+        }
+
+    from_dict = _make_from_dict("ExerciseSpec", _EXERCISE_SPEC_CONVERTERS)
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "ExerciseSpec":
-        return cls(
-            unit_id=str(payload["unit_id"]),
-            source_mode=str(payload["source_mode"]),
-            prompt=str(payload["prompt"]),
-            success_criteria=list(payload.get("success_criteria", [])),
-            timebox_minutes=int(payload["timebox_minutes"]),
-            kind=str(payload.get("kind", "core")),
-        )
 
+_LESSON_IDEA_CONVERTERS = [("text", str, ""), ("citation", str, "p.0")]
 
-@dataclass
+
+@dataclass(slots=True)
 class LessonIdea:
     text: str
     citation: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"text": self.text, "citation": self.citation}
+
+    from_dict = _make_from_dict("LessonIdea", _LESSON_IDEA_CONVERTERS)
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "LessonIdea":
-        if payload is None:
-            return cls(text="", citation="p.0")
-        return cls(
-            text=str(payload.get("text", "")),
-            citation=str(payload.get("citation", "p.0")),
-        )
 
+def _lesson_idea_list(items: Any) -> List[LessonIdea]:
+    return _model_list(items, LessonIdea)
 
-@dataclass
+
+_LESSON_PACK_CONVERTERS = [
+    ("unit_id", str, ""),
+    ("summary", str, ""),
+    ("key_ideas", _lesson_idea_list, []),
+    ("pitfalls", _lesson_idea_list, []),
+    ("reflection_questions", _str_list, []),
+    ("micro_drills", _str_list, []),
+    ("source_mode", str, "fallback_local"),
+]
+
+
+@dataclass(slots=True)
 class LessonPack:
     unit_id: str
     summary: str
@@ -111,38 +218,28 @@ class LessonPack:
         return {
             "unit_id": self.unit_id,
             "summary": self.summary,
-            "key_ideas": [item.to_dict() for item in self.key_ideas],
-            "pitfalls": [item.to_dict() for item in self.pitfalls],
+            "key_ideas": list(map(LessonIdea.to_dict, self.key_ideas)),
+            "pitfalls": list(map(LessonIdea.to_dict, self.pitfalls)),
             "reflection_questions": list(self.reflection_questions),
             "micro_drills": list(self.micro_drills),
             "source_mode": self.source_mode,
         }
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "LessonPack":
-        payload = payload or {}
-        key_ideas = payload.get("key_ideas", [])
-        pitfalls = payload.get("pitfalls", [])
-        return cls(
-            unit_id=str(payload.get("unit_id", "")),
-            summary=str(payload.get("summary", "")),
-            key_ideas=[
-                item if isinstance(item, LessonIdea) else LessonIdea.from_dict(item)
-                for item in key_ideas
-                if isinstance(item, (dict, LessonIdea))
-            ],
-            pitfalls=[
-                item if isinstance(item, LessonIdea) else LessonIdea.from_dict(item)
-                for item in pitfalls
-                if isinstance(item, (dict, LessonIdea))
-            ],
-            reflection_questions=[str(item) for item in payload.get("reflection_questions", [])],
-            micro_drills=[str(item) for item in payload.get("micro_drills", [])],
-            source_mode=str(payload.get("source_mode", "fallback_local")),
-        )
+    from_dict = _make_from_dict("LessonPack", _LESSON_PACK_CONVERTERS)
 
 
-@dataclass
+_FEEDBACK_REPORT_CONVERTERS = [
+    ("overall_score", int, 0),
+    ("rubric_scores", dict, {}),
+    ("strengths", list, []),
+    ("craft_risks", list, []),
+    ("line_notes", _line_note_list, []),
+    ("revision_plan", list, []),
+    ("unlock_eligible", bool, False),
+]
+
+
+@dataclass(slots=True)
 class FeedbackReport:
     overall_score: int
     rubric_scores: Dict[str, int]
@@ -153,28 +250,42 @@ class FeedbackReport:
     unlock_eligible: bool
 
     def to_dict(self) -> Dict[str, Any]:
-        payload = asdict(self)
-        payload["line_notes"] = [note.to_dict() for note in self.line_notes]
-        return payload
-
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "FeedbackReport":
-        line_notes = [
-            note if isinstance(note, LineNote) else LineNote.from_dict(note)
-            for note in payload.get("line_notes", [])
-        ]
-        return cls(
-            overall_score=int(payload.get("overall_score", 0)),
-            rubric_scores=dict(payload.get("rubric_scores", {})),
-            strengths=list(payload.get("strengths", [])),
-            craft_risks=list(payload.get("craft_risks", [])),
-            line_notes=line_notes,
-            revision_plan=list(payload.get("revision_plan", [])),
-            unlock_eligible=bool(payload.get("unlock_eligible", False)),
-        )
-
-
-@dataclass
+        return {
+            "overall_score": self.overall_score,
+            "rubric_scores": dict(self.rubric_scores),
+            "strengths": list(self.strengths),
+            "craft_risks": list(self.craft_risks),
+            "line_notes": [
+                {
+                    "line_number": note.line_number,
+                    "text_excerpt": note.text_excerpt,
+                    "comment": note.comment,
+                    "citation": note.citation,
+                }
+                for note in self.line_notes
+            ],
+            "revision_plan": list(self.revision_plan),
+            "unlock_eligible": self.unlock_eligible,
+        }
+
+    from_dict = _make_from_dict("FeedbackReport", _FEEDBACK_REPORT_CONVERTERS)
+
+
+_REVISION_MISSION_CONVERTERS = [
+    ("id", int, None),
+    ("unit_id", str, ""),
+    ("attempt_id", int, 0),
+    ("focus_dimension", str, ""),
+    ("title", str, ""),
+    ("instructions", str, ""),
+    ("checklist", _str_list, []),
+    ("status", str, "active"),
+    ("created_at", str, _UTC_NOW),
+    ("completed_at", str, None),
+]
+
+
+@dataclass(slots=True)
 class RevisionMission:
     id: Optional[int]
     unit_id: str
@@ -184,72 +295,83 @@ class RevisionMission:
     instructions: str
     checklist: List[str]
     status: str = "active"
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_now_iso)
     completed_at: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
-
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "RevisionMission":
-        payload = payload or {}
-        mission_id = payload.get("id")
-        return cls(
-            id=int(mission_id) if mission_id is not None else None,
-            unit_id=str(payload.get("unit_id", "")),
-            attempt_id=int(payload.get("attempt_id", 0)),
-            focus_dimension=str(payload.get("focus_dimension", "")),
-            title=str(payload.get("title", "")),
-            instructions=str(payload.get("instructions", "")),
-            checklist=[str(item) for item in payload.get("checklist", [])],
-            status=str(payload.get("status", "active")),
-            created_at=str(payload.get("created_at", datetime.utcnow().isoformat())),
-            completed_at=(
-                str(payload.get("completed_at")) if payload.get("completed_at") is not None else None
-            ),
-        )
-
-
-@dataclass
+        return {
+            "id": self.id,
+            "unit_id": self.unit_id,
+            "attempt_id": self.attempt_id,
+            "focus_dimension": self.focus_dimension,
+            "title": self.title,
+            "instructions": self.instructions,
+            "checklist": list(self.checklist),
+            "status": self.status,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+        }
+
+    from_dict = _make_from_dict("RevisionMission", _REVISION_MISSION_CONVERTERS)
+
+
+_PROGRESS_RECORD_CONVERTERS = [
+    ("current_unit_id", str, "0"),
+    ("unlocked_units", list, ["0"]),
+    ("attempts", _int_dict, {}),
+    ("best_score_by_unit", _int_dict, {}),
+    ("last_opened_at", str, _UTC_NOW),
+]
+
+
+@dataclass(slots=True)
 class ProgressRecord:
     current_unit_id: str
     unlocked_units: List[str]
     attempts: Dict[str, int]
     best_score_by_unit: Dict[str, int]
-    last_opened_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    last_opened_at: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "current_unit_id": self.current_unit_id,
+            "unlocked_units": list(self.unlocked_units),
+            "attempts": dict(self.attempts),
+            "best_score_by_unit": dict(self.best_score_by_unit),
+            "last_opened_at": self.last_opened_at,
+        }
+
+    from_dict = _make_from_dict("ProgressRecord", _PROGRESS_RECORD_CONVERTERS)
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "ProgressRecord":
-        return cls(
-            current_unit_id=str(payload.get("current_unit_id", "0")),
-            unlocked_units=list(payload.get("unlocked_units", ["0"])),
-            attempts={k: int(v) for k, v in payload.get("attempts", {}).items()},
-            best_score_by_unit={k: int(v) for k, v in payload.get("best_score_by_unit", {}).items()},
-            last_opened_at=str(payload.get("last_opened_at", datetime.utcnow().isoformat())),
-        )
 
+_COACH_EVIDENCE_CONVERTERS = [("quote", str, ""), ("citation", str, "p.0")]
 
-@dataclass
+
+@dataclass(slots=True)
 class CoachEvidence:
     quote: str
     citation: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"quote": self.quote, "citation": self.citation}
+
+    from_dict = _make_from_dict("CoachEvidence", _COACH_EVIDENCE_CONVERTERS)
+
+
+def _coach_evidence_list(items: Any) -> List[CoachEvidence]:
+    return _model_list(items, CoachEvidence)
+
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "CoachEvidence":
-        payload = payload or {}
-        return cls(
-            quote=str(payload.get("quote", "")),
-            citation=str(payload.get("citation", "p.0")),
-        )
+_COACH_ANSWER_CONVERTERS = [
+    ("answer", str, ""),
+    ("citations", _str_list, []),
+    ("evidence", _coach_evidence_list, []),
+    ("confidence", _float_or_zero, 0.0),
+    ("is_refusal", bool, False),
+]
 
 
-@dataclass
+@dataclass(slots=True)
 class CoachAnswer:
     answer: str
     citations: List[str]
@@ -261,28 +383,26 @@ class CoachAnswer:
         return {
             "answer": self.answer,
             "citations": list(self.citations),
-            "evidence": [item.to_dict() for item in self.evidence],
+            "evidence": list(map(CoachEvidence.to_dict, self.evidence)),
             "confidence": self.confidence,
             "is_refusal": self.is_refusal,
         }
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "CoachAnswer":
-        payload = payload or {}
-        return cls(
-            answer=str(payload.get("answer", "")),
-            citations=[str(item) for item in payload.get("citations", [])],
-            evidence=[
-                item if isinstance(item, CoachEvidence) else CoachEvidence.from_dict(item)
-                for item in payload.get("evidence", [])
-                if isinstance(item, (dict, CoachEvidence))
-            ],
-            confidence=float(payload.get("confidence", 0.0) or 0.0),
-            is_refusal=bool(payload.get("is_refusal", False)),
-        )
+    from_dict = _make_from_dict("CoachAnswer", _COACH_ANSWER_CONVERTERS)
+
 
+_CHAT_TURN_CONVERTERS = [
+    ("unit_id", str, ""),
+    ("question", str, ""),
+    ("answer", str, ""),
+    ("citations", _str_list, []),
+    ("evidence", _coach_evidence_list, []),
+    ("confidence", float, None),
+    ("created_at", str, _UTC_NOW),
+]
 
-@dataclass
+
+@dataclass(slots=True)
 class ChatTurn:
     unit_id: str
     question: str
@@ -291,7 +411,7 @@ class ChatTurn:
     evidence: List[CoachEvidence] = field(default_factory=list)
     confidence: Optional[float] = None
 
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -299,28 +419,9 @@ class ChatTurn:
             "question": self.question,
             "answer": self.answer,
             "citations": list(self.citations),
-            "evidence": [item.to_dict() for item in self.evidence],
+            "evidence": [{"quote": item.quote, "citation": item.citation} for item in self.evidence],
             "confidence": self.confidence,
             "created_at": self.created_at,
         }
 
-    @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "ChatTurn":
-        payload = payload or {}
-        return cls(
-            unit_id=str(payload.get("unit_id", "")),
-            question=str(payload.get("question", "")),
-            answer=str(payload.get("answer", "")),
-            citations=[str(item) for item in payload.get("citations", [])],
-            evidence=[
-                item if isinstance(item, CoachEvidence) else CoachEvidence.from_dict(item)
-                for item in payload.get("evidence", [])
-                if isinstance(item, (dict, CoachEvidence))
-            ],
-            confidence=(
-                float(payload.get("confidence"))
-                if payload.get("confidence") is not None
-                else None
-            ),
-            created_at=str(payload.get("created_at", datetime.utcnow().isoformat())),
-        )
+    from_dict = _make_from_dict("ChatTurn", _CHAT_TURN_CONVERTERS)
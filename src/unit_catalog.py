@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, NamedTuple, Tuple
 
+from . import jsonio
 from .config import units_path, data_dir
 from .types import CourseUnit
 
@@ -146,38 +148,67 @@ RAW_UNITS = [
 ]
 
 
+_DEFAULT_UNITS: Tuple[CourseUnit, ...] = tuple(CourseUnit.from_dict(unit) for unit in RAW_UNITS)
+
+
 def _default_units() -> List[CourseUnit]:
-    return [CourseUnit.from_dict(unit) for unit in RAW_UNITS]
+    # Fresh lists: callers may edit the returned units without touching `_DEFAULT_UNITS`.
+    return [
+        replace(unit, learning_objectives=list(unit.learning_objectives), source_chunks=list(unit.source_chunks))
+        for unit in _DEFAULT_UNITS
+    ]
+
+
+class _UnitCatalog(NamedTuple):
+    units: Tuple[CourseUnit, ...]
+    units_by_id: Dict[str, CourseUnit]
+    unit_ids: Tuple[str, ...]
+
+
+@lru_cache(maxsize=4)
+def _load_units_cached(path: str, mtime_ns: int) -> _UnitCatalog:
+    """Parse the units file once per (path, mtime) and index the units by id."""
 
+    try:
+        raw = jsonio.loads(Path(path).read_bytes())
+        units = tuple(CourseUnit.from_dict(item) for item in raw)
+    except Exception:
+        units = ()
+    return _UnitCatalog(
+        units=units,
+        units_by_id={unit.id: unit for unit in units},
+        unit_ids=tuple(unit.id for unit in units),
+    )
 
-def load_units() -> List[CourseUnit]:
+
+def _catalog() -> _UnitCatalog:
     path = units_path()
-    data_dir().mkdir(parents=True, exist_ok=True)
-    if path.exists():
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-            units = [CourseUnit.from_dict(item) for item in raw]
-            if units:
-                return units
-        except Exception:
-            pass
-    units = _default_units()
-    save_units(units)
-    return units
+    try:
+        catalog = _load_units_cached(str(path), path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        catalog = None
+    if catalog is not None and catalog.units:
+        return catalog
+    save_units(_default_units())
+    return _load_units_cached(str(path), path.stat().st_mtime_ns)
+
+
+def load_units() -> Tuple[CourseUnit, ...]:
+    """Return the course units as the shared cached tuple; re-parsed only when the file's mtime changes."""
+
+    return _catalog().units
 
 
 def save_units(units: List[CourseUnit]) -> None:
+    path = units_path()
     data_dir().mkdir(parents=True, exist_ok=True)
-    payload = [unit.to_dict() for unit in units]
-    units_path().write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(jsonio.dumps_indented([unit.to_dict() for unit in units]))
+    _load_units_cached.cache_clear()
 
 
 def unit_by_id(unit_id: str) -> CourseUnit | None:
-    for unit in load_units():
-        if unit.id == unit_id:
-            return unit
-    return None
+    return _catalog().units_by_id.get(unit_id)
 
 
-def unit_ids() -> List[str]:
-    return [unit.id for unit in load_units()]
+def unit_ids() -> Tuple[str, ...]:
+    return _catalog().unit_ids
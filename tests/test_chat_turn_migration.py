@@ -43,3 +43,18 @@ def test_chat_turn_migration_preserves_old_rows(tmp_path, monkeypatch):
     assert latest["citations"] == ["p.16"]
     assert latest["evidence"][0]["citation"] == "p.16"
     assert float(latest["confidence"]) == 0.82
+
+    conn = storage._connection()
+    kinds = conn.execute("SELECT typeof(citations) FROM chat_turns ORDER BY id").fetchall()
+    conn.close()
+    assert [row[0] for row in kinds] == ["text", "text"]
+
+
+def test_chat_turn_without_citations_reads_back_empty_lists(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+
+    storage.save_chat_turn("1", "Off topic?", "That is not covered in this course material.")
+
+    turn = storage.get_chat_turns("1", limit=1)[0]
+    assert turn["citations"] == []
+    assert turn["evidence"] == []
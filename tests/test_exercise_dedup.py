@@ -94,3 +94,38 @@ def test_load_or_build_exercises_accepts_valid_cache(tmp_path, monkeypatch):
     assert len(specs) == 2
     assert specs[0].prompt == "Core prompt"
     assert specs[1].prompt == "Stretch prompt"
+
+
+def test_load_or_build_exercises_rebuilds_from_near_duplicate_prompts(tmp_path, monkeypatch):
+    cache_path = tmp_path / "exercises.json"
+    monkeypatch.setattr("src.exercise_engine.exercises_path", lambda: cache_path)
+
+    unit = _unit()
+    cache_path.write_text(
+        json.dumps(
+            [
+                {
+                    "unit_id": "0",
+                    "source_mode": "legacy",
+                    "prompt": "Write the  scene.",
+                    "success_criteria": [],
+                    "timebox_minutes": 30,
+                    "kind": "core",
+                },
+                {
+                    "unit_id": "0",
+                    "source_mode": "legacy",
+                    "prompt": "write the scene",
+                    "success_criteria": [],
+                    "timebox_minutes": 50,
+                    "kind": "stretch",
+                },
+            ]
+        )
+    )
+
+    exercise_map = exercise_engine.load_or_build_exercises([unit], {"0": []})
+    specs = exercise_map["0"]
+    assert len(specs) == 2
+    assert specs[0].prompt != "Write the  scene."
+    assert len({spec.prompt for spec in specs}) == 2
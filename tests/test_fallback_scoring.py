@@ -1,9 +1,12 @@
+import pytest
+
 from src.feedback_engine import _fallback_report
 from src.types import CourseUnit
 
 
-def test_fallback_report_keeps_short_drafts_below_unlock_threshold():
-    unit = CourseUnit(
+@pytest.fixture(scope="module")
+def narrating_unit():
+    return CourseUnit(
         id="1",
         title="Narrating",
         start_page=16,
@@ -11,16 +14,10 @@ def test_fallback_report_keeps_short_drafts_below_unlock_threshold():
         learning_objectives=["Track focalization and perspective in prose."],
     )
 
-    draft = "\n".join([f"Sentence {idx}: sample craft sentence." for idx in range(1, 8)])
-    report = _fallback_report(unit, draft, [])
-
-    assert report.overall_score < 85
-    assert report.overall_score <= 80
-    assert all(0 <= score <= 100 for score in report.rubric_scores.values())
-
 
-def test_fallback_report_uses_actionable_feedback_items():
-    unit = CourseUnit(
+@pytest.fixture(scope="module")
+def dialogue_unit():
+    return CourseUnit(
         id="2",
         title="Dialogue",
         start_page=131,
@@ -28,6 +25,15 @@ def test_fallback_report_uses_actionable_feedback_items():
         learning_objectives=["Write dialogue that advances pressure and reveals perspective."],
     )
 
+
+@pytest.fixture(scope="module")
+def short_draft_report(narrating_unit):
+    draft = "\n".join([f"Sentence {idx}: sample craft sentence." for idx in range(1, 8)])
+    return _fallback_report(narrating_unit, draft, [])
+
+
+@pytest.fixture(scope="module")
+def dialogue_draft_report(dialogue_unit):
     draft = "\n".join(
         [
             "Mara stood by the window and watched the street light up.",
@@ -35,7 +41,19 @@ def test_fallback_report_uses_actionable_feedback_items():
             "The room felt too quiet.",
         ]
     )
-    report = _fallback_report(unit, draft, [])
+    return _fallback_report(dialogue_unit, draft, [])
+
+
+def test_fallback_report_keeps_short_drafts_below_unlock_threshold(short_draft_report):
+    report = short_draft_report
+
+    assert report.overall_score < 85
+    assert report.overall_score <= 80
+    assert all(0 <= score <= 100 for score in report.rubric_scores.values())
+
+
+def test_fallback_report_uses_actionable_feedback_items(dialogue_draft_report):
+    report = dialogue_draft_report
 
     assert len(report.strengths) >= 1
     assert len(report.craft_risks) >= 1
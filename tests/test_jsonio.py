@@ -0,0 +1,22 @@
+from src import jsonio
+from src.types import LineNote
+
+
+def test_load_file_reads_back_compact_and_indented_dumps(tmp_path):
+    payload = {"unit_id": "1", "citations": ["p.16", "p.17"], "score": 0.82, "title": "Café scene"}
+
+    compact = tmp_path / "compact.json"
+    compact.write_bytes(jsonio.dumps(payload))
+    indented = tmp_path / "indented.json"
+    indented.write_bytes(jsonio.dumps_indented(payload))
+
+    assert b"\n" not in compact.read_bytes()
+    assert b'\n  "unit_id"' in indented.read_bytes()
+    assert jsonio.load_file(compact) == payload
+    assert jsonio.load_file(indented) == payload
+
+
+def test_dumps_text_encodes_dataclass_models():
+    note = LineNote(line_number=3, text_excerpt="It was very sad.", comment="Show the loss.", citation="p.116")
+
+    assert jsonio.loads(jsonio.dumps_text(note)) == note.to_dict()
@@ -1,3 +1,6 @@
+import sqlite3
+import threading
+
 from src import storage
 from src.types import RevisionMission
 
@@ -40,3 +43,28 @@ def test_revision_mission_lifecycle(tmp_path, monkeypatch):
     updated_count = storage.supersede_active_revision_missions("1", new_attempt_id=5)
     assert updated_count == 1
     assert storage.get_active_revision_mission("1") is None
+
+
+def test_storage_shares_one_connection_per_database_across_threads(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+
+    with storage._db() as conn:
+        pass
+    storage.save_revision_mission(_mission("1", 3))
+
+    seen = []
+
+    def _read_from_worker():
+        with storage._db() as worker_conn:
+            seen.append(worker_conn)
+        seen.append(storage.get_active_revision_mission("1"))
+
+    workers = [threading.Thread(target=_read_from_worker) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert [item for item in seen if isinstance(item, sqlite3.Connection)] == [conn] * 4
+    missions = [item for item in seen if isinstance(item, RevisionMission)]
+    assert [mission.attempt_id for mission in missions] == [3] * 4
@@ -1,3 +1,7 @@
+import sqlite3
+
+import pytest
+
 from src import storage, types
 
 
@@ -25,14 +29,90 @@ def test_draft_save_and_load_round_trip(tmp_path, monkeypatch):
     assert storage.get_draft("0") == "First draft"
 
 
+def test_long_draft_round_trips_through_compression(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+    long_draft = "\n".join(f"Line {idx}: the rain kept time on the tin roof." for idx in range(40))
+
+    storage.save_draft("0", long_draft)
+    storage.flush_drafts()
+    assert storage.get_draft("0") == long_draft
+
+    storage.save_draft("0", "Short again")
+    storage.flush_drafts()
+    assert storage.get_draft("0") == "Short again"
+
+
+def test_rapid_draft_saves_coalesce_into_latest_text(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+
+    queued = []
+    real_enqueue_write = storage._enqueue_write
+
+    def _counting_enqueue_write(sql, params, path=None):
+        queued.append(params)
+        real_enqueue_write(sql, params, path=path)
+
+    monkeypatch.setattr(storage, "_enqueue_write", _counting_enqueue_write)
+
+    for idx in range(5):
+        storage.save_draft("0", f"Draft revision {idx}")
+    assert storage.get_draft("0") == "Draft revision 4"
+    assert queued == []
+
+    storage.flush_drafts()
+    assert [params[:2] for params in queued] == [("0", "Draft revision 4")]
+    assert storage.get_draft("0") == "Draft revision 4"
+
+
+def test_failing_queued_write_does_not_discard_rest_of_batch(tmp_path, monkeypatch, caplog):
+    db_file = str(tmp_path / "writer_course_state.db")
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", db_file)
+    insert = "INSERT INTO chat_turns (unit_id, question, answer, created_at) VALUES (?, ?, ?, ?)"
+
+    connections = {}
+    storage._apply_write_batch(
+        connections,
+        [
+            (db_file, insert, ("1", "Kept?", "Kept answer", "2026-02-14T00:00:00")),
+            (db_file, insert, ("1", "Broken?", None, "2026-02-14T00:00:01")),
+        ],
+    )
+    for conn, _file_id in connections.values():
+        conn.close()
+
+    assert [turn["answer"] for turn in storage.get_chat_turns("1")] == ["Kept answer"]
+    assert "Dropped queued write" in caplog.text
+
+
+def test_recreated_database_file_is_initialized_again(tmp_path, monkeypatch):
+    db_file = tmp_path / "writer_course_state.db"
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(db_file))
+
+    storage.save_draft("0", "Before reset")
+    storage.flush_drafts()
+    assert storage.get_draft("0") == "Before reset"
+
+    for leftover in tmp_path.glob("writer_course_state.db*"):
+        leftover.unlink()
+
+    assert storage.get_draft("0") == ""
+    storage.save_draft("0", "After reset")
+    storage.flush_drafts()
+    assert storage.get_draft("0") == "After reset"
+
+    conn = storage._connection()
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    assert journal_mode == "wal"
+
+
 def test_progress_round_trip_rounds_back_to_db(tmp_path, monkeypatch):
     monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
 
     progress = storage.load_progress(["0", "1"])
+    progress = storage.add_feedback_attempt(progress, "0", "Draft one", _report(82), ["0", "1"])
+    progress = storage.add_feedback_attempt(progress, "0", "Draft two", _report(88), ["0", "1"])
     progress.current_unit_id = "1"
-    progress.unlocked_units = ["0", "1"]
-    progress.best_score_by_unit = {"0": 88}
-    progress.attempts = {"0": 2}
 
     storage.persist_progress(progress)
     reloaded = storage.load_progress(["0", "1"])
@@ -56,3 +136,99 @@ def test_export_portfolio_includes_attempts(tmp_path, monkeypatch):
     assert len(portfolio["units"][0]["attempts"]) == 2
     assert portfolio["units"][0]["attempts"][0]["draft"] == "Draft one"
     assert portfolio["units"][0]["attempts"][1]["draft"] == "Draft two"
+
+
+def test_failed_progress_write_releases_shared_connection(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+    progress = storage.load_progress(["0"])
+    with storage._db() as conn:
+        conn.execute(
+            "CREATE TRIGGER reject_progress BEFORE UPDATE ON progress BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        storage.persist_progress(progress)
+
+    with storage._db() as conn:
+        assert not conn.in_transaction
+    storage.save_chat_turn("0", "Still writable?", "Yes.")
+    assert [turn["answer"] for turn in storage.get_chat_turns("0")] == ["Yes."]
+
+
+def test_optimize_db_writes_planner_statistics(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+    progress = storage.load_progress(["0", "1"])
+    for idx in range(20):
+        progress = storage.add_feedback_attempt(progress, str(idx % 2), f"Draft {idx}", _report(70), ["0", "1"])
+    storage.get_attempts_for_unit("0")
+
+    storage.optimize_db()
+
+    conn = storage._connection()
+    tables = {row["tbl"] for row in conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()}
+    conn.close()
+    assert "attempts" in tables
+
+
+def test_export_portfolio_orders_same_timestamp_attempts_by_id(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+    with storage._db() as conn, conn:
+        conn.executemany(
+            "INSERT INTO attempts (unit_id, draft, overall_score, feedback_json, created_at) VALUES (?, ?, ?, ?, ?)",
+            [("0", f"Draft {idx}", 70, "{}", "2026-02-14T00:00:00") for idx in range(5)],
+        )
+
+    portfolio = storage.export_portfolio(["0"])
+
+    attempts = portfolio["units"][0]["attempts"]
+    assert [attempt["draft"] for attempt in attempts] == [f"Draft {idx}" for idx in range(5)]
+
+
+@pytest.mark.parametrize("sqlite_version", [sqlite3.sqlite_version_info, (3, 34, 1)])
+def test_load_progress_migrates_legacy_progress_columns(tmp_path, monkeypatch, sqlite_version):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+    monkeypatch.setattr(sqlite3, "sqlite_version_info", sqlite_version)
+
+    conn = storage._connection()
+    conn.executescript(
+        """
+        CREATE TABLE progress (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            current_unit_id TEXT NOT NULL,
+            unlocked_units TEXT NOT NULL,
+            attempts TEXT NOT NULL,
+            best_score_by_unit TEXT NOT NULL,
+            last_opened_at TEXT NOT NULL
+        );
+        INSERT INTO progress VALUES (1, '1', '["0", "1"]', '{"0": 5}', '{"0": 99}', '2026-02-14T00:00:00');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    progress = storage.load_progress(["0", "1"])
+
+    assert progress.current_unit_id == "1"
+    assert progress.unlocked_units == ["0", "1"]
+    assert progress.attempts == {}
+    assert progress.best_score_by_unit == {}
+
+    storage.persist_progress(progress)
+    conn = storage._connection()
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(progress)").fetchall()]
+    conn.close()
+    assert columns == ["id", "current_unit_id", "unlocked_units", "last_opened_at"]
+
+
+def test_latest_feedback_for_unit_returns_newest_report(tmp_path, monkeypatch):
+    monkeypatch.setenv("WRITER_COURSE_DB_PATH", str(tmp_path / "writer_course_state.db"))
+    progress = storage.load_progress(["0"])
+
+    assert storage.get_latest_feedback_for_unit("0") is None
+
+    progress = storage.add_feedback_attempt(progress, "0", "Draft one", _report(70), ["0"])
+    progress = storage.add_feedback_attempt(progress, "0", "Draft two", _report(91), ["0"])
+
+    latest = storage.get_latest_feedback_for_unit("0")
+    assert latest is not None
+    assert latest.overall_score == 91
@@ -1,4 +1,8 @@
-from src.unit_catalog import load_units
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from src.unit_catalog import _default_units, load_units, save_units, unit_by_id, unit_ids
 
 
 def test_unit_map_matches_expected_ranges():
@@ -24,3 +28,47 @@ def test_unit_map_matches_expected_ranges():
         expected_start, expected_end = expected[unit.id]
         assert unit.start_page == expected_start
         assert unit.end_page == expected_end
+
+
+def test_unit_cache_picks_up_saved_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.unit_catalog.units_path", lambda: tmp_path / "units.json")
+    monkeypatch.setattr("src.unit_catalog.data_dir", lambda: tmp_path)
+
+    units = load_units()
+    assert len(units) == 12
+    assert unit_by_id("10").title == "Dialogue"
+
+    save_units(units[:2])
+
+    assert [unit.id for unit in load_units()] == ["0", "1"]
+    assert unit_ids() == ("0", "1")
+    assert unit_by_id("10") is None
+
+
+def test_default_units_are_independent_copies():
+    first = _default_units()
+    first[0].learning_objectives.append("Extra objective.")
+
+    fresh = _default_units()
+    assert "Extra objective." not in fresh[0].learning_objectives
+
+
+def test_saving_an_edited_default_unit_writes_the_edit(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.unit_catalog.units_path", lambda: tmp_path / "units.json")
+    monkeypatch.setattr("src.unit_catalog.data_dir", lambda: tmp_path)
+
+    units = _default_units()
+    units[0] = replace(units[0], title="Renamed Orientation")
+    save_units(units)
+
+    assert unit_by_id("0").title == "Renamed Orientation"
+    assert _default_units()[0].title == "Orientation"
+
+
+def test_cached_units_cannot_be_reassigned(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.unit_catalog.units_path", lambda: tmp_path / "units.json")
+    monkeypatch.setattr("src.unit_catalog.data_dir", lambda: tmp_path)
+
+    with pytest.raises(FrozenInstanceError):
+        load_units()[0].source_chunks = ["0:7:0"]
+    assert unit_by_id("0").source_chunks == []